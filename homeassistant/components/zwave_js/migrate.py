@@ -142,8 +142,9 @@ def async_migrate_discovered_value(
     disc_info: ZwaveDiscoveryInfo,
 ) -> None:
     """Migrate unique ID for entity/entities tied to discovered value."""
+    primary_value = disc_info.primary_value
 
-    new_unique_id = get_unique_id(driver, disc_info.primary_value.value_id)
+    new_unique_id = get_unique_id(driver, primary_value.value_id)
 
     # On reinterviews, there is no point in going through this logic again for already
     # discovered values
@@ -156,14 +157,14 @@ def async_migrate_discovered_value(
     # 2021.2.*, 2021.3.0b0, and 2021.3.0 formats
     old_unique_ids = [
         get_unique_id(driver, value_id)
-        for value_id in get_old_value_ids(disc_info.primary_value)
+        for value_id in get_old_value_ids(primary_value)
     ]
 
     if (
         disc_info.platform == "binary_sensor"
         and disc_info.platform_hint == "notification"
     ):
-        for state_key in disc_info.primary_value.metadata.states:
+        for state_key in primary_value.metadata.states:
             # ignore idle key (0)
             if state_key == "0":
                 continue
@@ -215,6 +216,7 @@ def async_migrate_discovered_value(
 def get_old_value_ids(value: ZwaveValue) -> list[str]:
     """Get old value IDs so we can migrate entity unique ID."""
     value_ids = []
+    node_id = value.node.node_id
 
     # Pre 2021.3.0 value ID
     command_class = value.command_class
@@ -222,7 +224,7 @@ def get_old_value_ids(value: ZwaveValue) -> list[str]:
     property_ = value.property_
     property_key_name = value.property_key_name or "00"
     value_ids.append(
-        f"{value.node.node_id}.{value.node.node_id}-{command_class}-{endpoint}-"
+        f"{node_id}.{node_id}-{command_class}-{endpoint}-"
         f"{property_}-{property_key_name}"
     )
 
@@ -231,10 +233,10 @@ def get_old_value_ids(value: ZwaveValue) -> list[str]:
     property_key_name = value.property_key_name or "00"
 
     value_id = (
-        f"{value.node.node_id}-{command_class}-{endpoint}-"
+        f"{node_id}-{command_class}-{endpoint}-"
         f"{property_}-{property_key}-{property_key_name}"
     )
     # 2021.3.0b0 and 2021.3.0 value IDs
-    value_ids.extend([f"{value.node.node_id}.{value_id}", value_id])
+    value_ids.extend([f"{node_id}.{value_id}", value_id])
 
     return value_ids